@@ -1,8 +1,17 @@
 import os
+import re
+import threading
+import time
+import unicodedata
 import streamlit as st
-import requests
-import json
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+# Network/serialization clients are imported lazily inside the helpers that use them
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
 
 # =====================================================
 # CONFIGURATION
@@ -14,6 +23,18 @@ API_BASE_URL = os.getenv(
 
 HEALTH_URL = f"{API_BASE_URL}/deep-health"
 
+# Fail fast on an unreachable host; keep the longer budget for slow responses
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30
+SPELLING_READ_TIMEOUT = 10
+HEALTH_CONNECT_TIMEOUT = 2
+HEALTH_READ_TIMEOUT = 5
+
+SPELLING_CACHE_SIZE = 4096
+
+# Ping the backend this often so the hosted container never scales to zero
+WARM_INTERVAL_SECONDS = 240
+
 st.set_page_config(
     page_title="Hybrid Search & Organization Finder",
     page_icon="🔍",
@@ -34,57 +55,208 @@ st.markdown(
 # =====================================================
 # HELPER FUNCTIONS
 # =====================================================
+_WS_RE = re.compile(r"\s+")
+_EMPTY_RE = re.compile(r"^\s*$")
+
+NA = "N/A"
+NO_PATH = "-"
+
+@st.cache_resource
+def get_client() -> "httpx.Client":
+    # One pooled HTTP/2 client multiplexing all calls over a shared connection
+    import httpx
+    
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30)
+    return httpx.Client(
+        # No connect retries: each one would add a full CONNECT_TIMEOUT before "unreachable"
+        transport=httpx.HTTPTransport(http2=True, limits=limits, retries=0),
+        headers={"Content-Type": "application/json"},
+        timeout=httpx.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT, write=10, pool=5)
+    )
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    # Background workers for requests that can overlap with the main search
+    return ThreadPoolExecutor(max_workers=16)
+
+@st.cache_resource
+def get_spelling_corrector() -> Callable[[str], str]:
+    # The memo lives in a cached resource so it survives script reruns; it is
+    # called from executor threads, hence the lock
+    import httpx
+    import orjson
+    
+    client = get_client()
+    corrections: "OrderedDict[str, str]" = OrderedDict()
+    lock = threading.Lock()
+    
+    def correct_spelling(query: str) -> str:
+        with lock:
+            if query in corrections:
+                corrections.move_to_end(query)
+                return corrections[query]
+        
+        # Failures raise here, so they are never memoized
+        spell_response = client.post(
+            f"{API_BASE_URL}/spellingcorrection",
+            content=orjson.dumps({"query": query}),
+            timeout=httpx.Timeout(SPELLING_READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+        )
+        spell_response.raise_for_status()
+        corrected = orjson.loads(spell_response.content).get("corrected_query", query)
+        
+        with lock:
+            corrections[query] = corrected
+            if len(corrections) > SPELLING_CACHE_SIZE:
+                corrections.popitem(last=False)
+        return corrected
+    
+    return correct_spelling
+
+def collapse_whitespace(query: str) -> str:
+    return _WS_RE.sub(" ", query).strip()
+
+def normalize_query(query: str) -> str:
+    # Cache key only: casefold() mangles Azerbaijani İ/I, so never send this to the API
+    return collapse_whitespace(unicodedata.normalize("NFKC", query).casefold())
+
+def is_empty_query(query: str) -> bool:
+    return _EMPTY_RE.match(query) is not None
+
+def _search_payload(query: str, size: int, use_vector: bool, alpha: float) -> dict:
+    return {
+        "query": query,
+        "size": size,
+        "alpha": alpha,
+        "use_vector": use_vector
+    }
+
+@st.cache_data(ttl=300, max_entries=512, show_spinner=False)
+def _do_search(
+    query_key: str,
+    _query: str,
+    size: int,
+    use_vector: bool,
+    alpha: float,
+    language: str
+) -> dict:
+    import orjson
+    
+    response = get_client().post(
+        f"{API_BASE_URL}/search/{language}",
+        content=orjson.dumps(_search_payload(_query, size, use_vector, alpha))
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _stream_search(
+    query: str,
+    size: int,
+    use_vector: bool,
+    alpha: float,
+    language: str
+) -> Iterator[List[dict]]:
+    import ijson
+    import orjson
+    
+    # Parse "Ranked-objects" incrementally and yield the hits decoded from each chunk
+    hits = ijson.sendable_list()
+    parser = ijson.items_coro(hits, "Ranked-objects.item", use_float=True)
+    
+    with get_client().stream(
+        "POST",
+        f"{API_BASE_URL}/search/{language}",
+        content=orjson.dumps(_search_payload(query, size, use_vector, alpha))
+    ) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes():
+            parser.send(chunk)
+            if hits:
+                yield list(hits)
+                del hits[:]
+    
+    parser.close()
+    if hits:
+        yield list(hits)
+
+def _apply_spelling(spell_future: Future, search_text: str) -> str:
+    try:
+        corrected = collapse_whitespace(spell_future.result())
+    except Exception as e:
+        st.warning(f"Spelling correction unavailable: {e}")
+        return search_text
+    
+    if corrected != search_text:
+        st.info(f"✨ Using corrected query: `{corrected}`")
+    return corrected
+
 def search_api(
     query: str,
     size: int,
     use_vector: bool,
     alpha: float,
     language: str,
-    use_spelling: bool = False
+    use_spelling: bool = False,
+    stream: bool = False
 ):
-    # Apply spelling correction if enabled
-    search_query = query
-    if use_spelling:
-        try:
-            spell_response = requests.post(
-                f"{API_BASE_URL}/spellingcorrection",
-                json={"query": query},
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-            if spell_response.status_code == 200:
-                spell_data = spell_response.json()
-                corrected = spell_data.get("corrected_query", query)
-                if corrected != query:
-                    st.info(f"✨ Using corrected query: `{corrected}`")
-                    search_query = corrected
-        except Exception as e:
-            st.warning(f"Spelling correction unavailable: {e}")
+    import httpx
+    import ijson
     
-    payload = {
-        "query": search_query,
-        "size": size,
-        "alpha": alpha,
-        "use_vector": use_vector
-    }
+    # The backend gets the user's text as typed (whitespace-collapsed); identical
+    # intents still share a cache entry regardless of case/spacing
+    search_text = collapse_whitespace(query)
+    query_key = normalize_query(search_text)
+    alpha = round(alpha, 2)
+    
+    # Fire spelling correction in the background while the raw query is searched
+    spell_future = None
+    if use_spelling:
+        spell_future = get_executor().submit(get_spelling_corrector(), search_text)
     
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/search/{language}",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.Timeout:
+        if stream:
+            # Streaming bypasses the result cache, so settle the spelling first
+            if spell_future is not None:
+                # A host that refused the spelling call will refuse the stream too
+                spell_error = spell_future.exception()
+                if isinstance(spell_error, (httpx.ConnectTimeout, httpx.ConnectError)):
+                    raise spell_error
+                search_text = _apply_spelling(spell_future, search_text)
+            
+            hits = []
+            with st.status("Streaming results...") as status:
+                for batch in _stream_search(search_text, size, use_vector, alpha, language):
+                    hits.extend(batch)
+                    status.update(label=f"Streaming results... {len(hits)} received")
+                status.update(label=f"Received {len(hits)} hits", state="complete")
+            
+            # The streaming parser only extracts hits, so total-hits is the received count
+            return {"total-hits": len(hits), "Ranked-objects": hits}
+        
+        result = _do_search(query_key, search_text, size, use_vector, alpha, language)
+        
+        if spell_future is not None:
+            # Only pay for a second search when the correction changed the query
+            corrected = _apply_spelling(spell_future, search_text)
+            corrected_key = normalize_query(corrected)
+            if corrected_key != query_key:
+                result = _do_search(corrected_key, corrected, size, use_vector, alpha, language)
+        
+        return result
+    except (httpx.ConnectTimeout, httpx.ConnectError):
+        st.error("🔌 Backend unreachable. Please try again later.")
+        return None
+    except httpx.TimeoutException:
         st.error("⏱️ Request timed out. Please try again.")
         return None
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, ijson.JSONError, ValueError) as e:
         st.error(f"❌ Request failed: {e}")
         return None
 
 def search_organizations(search_term: str, size: int):
+    import httpx
+    import orjson
+    
     payload = {
         "search_term": search_term,
         "index": "organizations_v3",
@@ -92,232 +264,199 @@ def search_organizations(search_term: str, size: int):
     }
     
     try:
-        response = requests.post(
+        response = get_client().post(
             f"{API_BASE_URL}/organizations",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30
+            content=orjson.dumps(payload)
         )
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return orjson.loads(response.content)
+    except (httpx.ConnectTimeout, httpx.ConnectError):
+        st.error("🔌 Backend unreachable. Please try again later.")
+        return None
+    except (httpx.HTTPError, ValueError) as e:
         st.error(f"❌ Request failed: {e}")
         return None
 
-# =====================================================
-# CREATE TABS
-# =====================================================
-tab1, tab2, tab3, tab4 = st.tabs(["🇦🇿 Search AZ", "🇬🇧 Search EN", "🇷🇺 Search RU", "🏢 Organization Search"])
+@st.cache_data(ttl=15, show_spinner=False)
+def check_health() -> dict:
+    import httpx
+    import orjson
+    
+    response = get_client().get(
+        HEALTH_URL,
+        timeout=httpx.Timeout(HEALTH_READ_TIMEOUT, connect=HEALTH_CONNECT_TIMEOUT)
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
-# =====================================================
-# TAB 1: AZERBAIJANI SEARCH
-# =====================================================
-with tab1:
-    st.header("Hybrid Search - Azerbaijani")
+def health_status(force_refresh: bool = False) -> Tuple[Optional[dict], Optional[str]]:
+    import httpx
     
-    with st.form("search_form_az"):
-        query_az = st.text_input("Enter your search query:", placeholder="e.g. alüminium lövhələr")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            size_az = st.number_input("Number of results", min_value=1, max_value=50, value=10)
-        with col2:
-            alpha_az = st.slider("Vector weight (alpha)", 0.0, 1.0, 0.5, step=0.1, key="alpha_az")
-        with col3:
-            use_vector_az = st.checkbox("Use Vector Search", value=True, key="vector_az")
-        with col4:
-            use_spelling_az = st.checkbox("Spelling correction", value=False, key="spell_az")
-        
-        submitted_az = st.form_submit_button("Run Search")
+    if force_refresh:
+        check_health.clear()
+    try:
+        return check_health(), None
+    except httpx.HTTPStatusError as e:
+        return None, f"⚠️ API returned status: {e.response.status_code}"
+    except httpx.HTTPError as e:
+        return None, f"❌ Cannot connect to API: {e}"
+    except ValueError as e:
+        return None, f"⚠️ API returned an invalid response: {e}"
+
+@st.cache_resource(show_spinner=False)
+def start_warmer() -> threading.Thread:
+    import httpx
     
-    if submitted_az:
-        if not query_az.strip():
-            st.warning("⚠️ Please enter a query.")
-        else:
-            with st.spinner("Searching..."):
-                result = search_api(query_az, size_az, use_vector_az, alpha_az, "az", use_spelling_az)
-            
-            if result:
-                st.success(f"✅ Found {result.get('total-hits', 0)} hits")
-                
-                hits: List[dict] = result.get("Ranked-objects", [])
-                if not hits:
-                    st.info("No results found.")
-                else:
-                    for i, hit in enumerate(hits, start=1):
-                        source = hit.get('_source', hit)
-                        name_display = source.get('name_az_d4', source.get('code', 'No Name'))
-                        
-                        with st.expander(f"#{i} - {name_display}"):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Code:** `{source.get('code', 'N/A')}`")
-                                score = hit.get('_score') or source.get('score')
-                                if score:
-                                    st.markdown(f"**Score:** {score:.4f}")
-                                
-                                st.markdown(f"**Category (D1):** {source.get('name_az_d1', 'N/A')}")
-                                st.markdown(f"**Subcategory (D2):** {source.get('name_az_d2', 'N/A')}")
-                                st.markdown(f"**Sub-subcategory (D3):** {source.get('name_az_d3', 'N/A')}")
-                                st.markdown(f"**Product (D4):** {source.get('name_az_d4', 'N/A')}")
-                                st.markdown(f"**Full Path:** {source.get('Path', '-')}")
-                            
-                            with col2:
-                                tradings = source.get("tradings", [])
-                                if tradings:
-                                    st.markdown("**Tradings:**")
-                                    for t in tradings:
-                                        trade_type = t.get("tradeType", "N/A")
-                                        trade_name = t.get("tradeName", "N/A")
-                                        st.write(f"• {trade_name} ({trade_type})")
-                                        
-                                        if t.get("inVehicleId"):
-                                            st.write(f"  In: Vehicle {t.get('inVehicleId')}")
-                                        if t.get("outVehicleId"):
-                                            st.write(f"  Out: Vehicle {t.get('outVehicleId')}")
-                                else:
-                                    st.markdown("*No trading info*")
+    client = get_client()
+    timeout = httpx.Timeout(HEALTH_READ_TIMEOUT, connect=HEALTH_CONNECT_TIMEOUT)
+    
+    def loop():
+        while True:
+            try:
+                client.get(HEALTH_URL, timeout=timeout)
+            except Exception:
+                pass
+            time.sleep(WARM_INTERVAL_SECONDS)
+    
+    thread = threading.Thread(target=loop, name="backend-warmer", daemon=True)
+    thread.start()
+    return thread
+
+start_warmer()
 
 # =====================================================
-# TAB 2: ENGLISH SEARCH
+# SEARCH TAB RENDERING
 # =====================================================
-with tab2:
-    st.header("Hybrid Search - English")
+LANG_META = {
+    "az": {"label": "🇦🇿 Search AZ", "name": "Azerbaijani", "placeholder": "alüminium lövhələr"},
+    "en": {"label": "🇬🇧 Search EN", "name": "English", "placeholder": "aluminium sheets"},
+    "ru": {"label": "🇷🇺 Search RU", "name": "Russian", "placeholder": "алюминиевые листы"},
+}
+
+def hit_score(hit: dict, source: dict):
+    # `_score` wins when present, even if it is 0.0
+    score = hit.get('_score')
+    return source.get('score') if score is None else score
+
+def format_tradings(tradings: List[dict]) -> str:
+    lines = ["**Tradings:**"]
+    for t in tradings:
+        lines.append(f"- {t.get('tradeName', NA)} ({t.get('tradeType', NA)})")
+        if t.get("inVehicleId"):
+            lines.append(f"  - In: Vehicle {t['inVehicleId']}")
+        if t.get("outVehicleId"):
+            lines.append(f"  - Out: Vehicle {t['outVehicleId']}")
+    return "\n".join(lines)
+
+def render_hit(hit: dict, lang: str, i: int):
+    # Resolve every field once up front; the markdown below only formats locals
+    source = hit.get('_source', hit)
+    d4_key = f'name_{lang}_d4'
+    code = source.get('code', NA)
+    d1 = source.get(f'name_{lang}_d1', NA)
+    d2 = source.get(f'name_{lang}_d2', NA)
+    d3 = source.get(f'name_{lang}_d3', NA)
+    d4 = source.get(d4_key, NA)
+    path = source.get('Path', NO_PATH)
+    score = hit_score(hit, source)
+    tradings = source.get("tradings", [])
+    name_display = d4 if d4_key in source else source.get('code', 'No Name')
     
-    with st.form("search_form_en"):
-        query_en = st.text_input("Enter your search query:", placeholder="e.g. aluminium sheets")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            size_en = st.number_input("Number of results", min_value=1, max_value=50, value=10)
-        with col2:
-            alpha_en = st.slider("Vector weight (alpha)", 0.0, 1.0, 0.5, step=0.1, key="alpha_en")
-        with col3:
-            use_vector_en = st.checkbox("Use Vector Search", value=True, key="vector_en")
-        with col4:
-            use_spelling_en = st.checkbox("Spelling correction", value=False, key="spell_en")
-        
-        submitted_en = st.form_submit_button("Run Search")
+    fields = [f"**Code:** `{code}`"]
+    if isinstance(score, (int, float)):
+        fields.append(f"**Score:** {score:.4f}")
+    fields += [
+        f"**Category (D1):** {d1}",
+        f"**Subcategory (D2):** {d2}",
+        f"**Sub-subcategory (D3):** {d3}",
+        f"**Product (D4):** {d4}",
+        f"**Full Path:** {path}",
+    ]
     
-    if submitted_en:
-        if not query_en.strip():
-            st.warning("⚠️ Please enter a query.")
-        else:
-            with st.spinner("Searching..."):
-                result = search_api(query_en, size_en, use_vector_en, alpha_en, "en", use_spelling_en)
-            
-            if result:
-                st.success(f"✅ Found {result.get('total-hits', 0)} hits")
-                
-                hits: List[dict] = result.get("Ranked-objects", [])
-                if not hits:
-                    st.info("No results found.")
-                else:
-                    for i, hit in enumerate(hits, start=1):
-                        source = hit.get('_source', hit)
-                        name_display = source.get('name_en_d4', source.get('code', 'No Name'))
-                        
-                        with st.expander(f"#{i} - {name_display}"):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Code:** `{source.get('code', 'N/A')}`")
-                                score = hit.get('_score') or source.get('score')
-                                if score:
-                                    st.markdown(f"**Score:** {score:.4f}")
-                                
-                                st.markdown(f"**Category (D1):** {source.get('name_en_d1', 'N/A')}")
-                                st.markdown(f"**Subcategory (D2):** {source.get('name_en_d2', 'N/A')}")
-                                st.markdown(f"**Sub-subcategory (D3):** {source.get('name_en_d3', 'N/A')}")
-                                st.markdown(f"**Product (D4):** {source.get('name_en_d4', 'N/A')}")
-                                st.markdown(f"**Full Path:** {source.get('Path', '-')}")
-                            
-                            with col2:
-                                tradings = source.get("tradings", [])
-                                if tradings:
-                                    st.markdown("**Tradings:**")
-                                    for t in tradings:
-                                        trade_type = t.get("tradeType", "N/A")
-                                        trade_name = t.get("tradeName", "N/A")
-                                        st.write(f"• {trade_name} ({trade_type})")
-                                        
-                                        if t.get("inVehicleId"):
-                                            st.write(f"  In: Vehicle {t.get('inVehicleId')}")
-                                        if t.get("outVehicleId"):
-                                            st.write(f"  Out: Vehicle {t.get('outVehicleId')}")
-                                else:
-                                    st.markdown("*No trading info*")
+    fields.append(format_tradings(tradings) if tradings else "*No trading info*")
+    
+    st.subheader(f"#{i} - {name_display}")
+    st.markdown("\n\n".join(fields))
 
-# =====================================================
-# TAB 3: RUSSIAN SEARCH
-# =====================================================
-with tab3:
-    st.header("Hybrid Search - Russian")
+def hits_table(hits: List[dict], lang: str) -> "pd.DataFrame":
+    import pandas as pd
+    
+    rows = []
+    for i, hit in enumerate(hits, start=1):
+        source = hit.get('_source', hit)
+        rows.append({
+            "#": i,
+            "Code": source.get('code'),
+            "Score": hit_score(hit, source),
+            "D4": source.get(f'name_{lang}_d4'),
+            "Path": source.get('Path'),
+        })
+    return pd.DataFrame(rows)
+
+def render_search_tab(lang: str, placeholder: str):
+    st.header(f"Hybrid Search - {LANG_META[lang]['name']}")
     
-    with st.form("search_form_ru"):
-        query_ru = st.text_input("Enter your search query:", placeholder="e.g. алюминиевые листы")
+    with st.form(f"search_form_{lang}"):
+        query = st.text_input("Enter your search query:", placeholder=f"e.g. {placeholder}")
         
-        col1, col2, col3, col4 = st.columns(4)
+        col1, col2, col3, col4, col5 = st.columns(5)
         with col1:
-            size_ru = st.number_input("Number of results", min_value=1, max_value=50, value=10)
+            size = st.number_input("Number of results", min_value=1, max_value=50, value=10)
         with col2:
-            alpha_ru = st.slider("Vector weight (alpha)", 0.0, 1.0, 0.5, step=0.1, key="alpha_ru")
+            alpha = st.slider("Vector weight (alpha)", 0.0, 1.0, 0.5, step=0.1, key=f"alpha_{lang}")
         with col3:
-            use_vector_ru = st.checkbox("Use Vector Search", value=True, key="vector_ru")
+            use_vector = st.checkbox("Use Vector Search", value=True, key=f"vector_{lang}")
         with col4:
-            use_spelling_ru = st.checkbox("Spelling correction", value=False, key="spell_ru")
+            use_spelling = st.checkbox("Spelling correction", value=False, key=f"spell_{lang}")
+        with col5:
+            stream = st.checkbox("Stream results", value=False, key=f"stream_{lang}")
         
-        submitted_ru = st.form_submit_button("Run Search")
+        submitted = st.form_submit_button("Run Search")
     
-    if submitted_ru:
-        if not query_ru.strip():
+    # Results live in session state so row-selection reruns keep them around
+    if submitted:
+        if is_empty_query(query):
             st.warning("⚠️ Please enter a query.")
+            st.session_state.pop(f"result_{lang}", None)
         else:
             with st.spinner("Searching..."):
-                result = search_api(query_ru, size_ru, use_vector_ru, alpha_ru, "ru", use_spelling_ru)
+                st.session_state[f"result_{lang}"] = search_api(query, size, use_vector, alpha, lang, use_spelling, stream)
+    
+    result = st.session_state.get(f"result_{lang}")
+    if result:
+        st.success(f"✅ Found {result.get('total-hits', 0)} hits")
+        
+        hits: List[dict] = result.get("Ranked-objects", [])
+        if not hits:
+            st.info("No results found.")
+        else:
+            # One table for all hits; full details only for the selected row
+            event = st.dataframe(
+                hits_table(hits, lang),
+                key=f"hits_{lang}",
+                on_select="rerun",
+                selection_mode="single-row",
+                hide_index=True,
+                use_container_width=True
+            )
             
-            if result:
-                st.success(f"✅ Found {result.get('total-hits', 0)} hits")
-                
-                hits: List[dict] = result.get("Ranked-objects", [])
-                if not hits:
-                    st.info("No results found.")
-                else:
-                    for i, hit in enumerate(hits, start=1):
-                        source = hit.get('_source', hit)
-                        name_display = source.get('name_ru_d4', source.get('code', 'No Name'))
-                        
-                        with st.expander(f"#{i} - {name_display}"):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Code:** `{source.get('code', 'N/A')}`")
-                                score = hit.get('_score') or source.get('score')
-                                if score:
-                                    st.markdown(f"**Score:** {score:.4f}")
-                                
-                                st.markdown(f"**Category (D1):** {source.get('name_ru_d1', 'N/A')}")
-                                st.markdown(f"**Subcategory (D2):** {source.get('name_ru_d2', 'N/A')}")
-                                st.markdown(f"**Sub-subcategory (D3):** {source.get('name_ru_d3', 'N/A')}")
-                                st.markdown(f"**Product (D4):** {source.get('name_ru_d4', 'N/A')}")
-                                st.markdown(f"**Full Path:** {source.get('Path', '-')}")
-                            
-                            with col2:
-                                tradings = source.get("tradings", [])
-                                if tradings:
-                                    st.markdown("**Tradings:**")
-                                    for t in tradings:
-                                        trade_type = t.get("tradeType", "N/A")
-                                        trade_name = t.get("tradeName", "N/A")
-                                        st.write(f"• {trade_name} ({trade_type})")
-                                        
-                                        if t.get("inVehicleId"):
-                                            st.write(f"  In: Vehicle {t.get('inVehicleId')}")
-                                        if t.get("outVehicleId"):
-                                            st.write(f"  Out: Vehicle {t.get('outVehicleId')}")
-                                else:
-                                    st.markdown("*No trading info*")
+            selected = event.selection.rows
+            if selected and selected[0] < len(hits):
+                render_hit(hits[selected[0]], lang, selected[0] + 1)
+            else:
+                st.caption("Select a row to see its full details.")
+
+# =====================================================
+# CREATE TABS
+# =====================================================
+*lang_tabs, tab4 = st.tabs([meta["label"] for meta in LANG_META.values()] + ["🏢 Organization Search"])
+
+# =====================================================
+# TABS 1-3: HS CODE SEARCH (AZ / EN / RU)
+# =====================================================
+for tab, lang in zip(lang_tabs, LANG_META):
+    with tab:
+        render_search_tab(lang, LANG_META[lang]["placeholder"])
 
 # =====================================================
 # TAB 4: ORGANIZATION SEARCH
@@ -333,7 +472,7 @@ with tab4:
         submitted_org = st.form_submit_button("Search Organizations")
     
     if submitted_org:
-        if not search_term.strip():
+        if is_empty_query(search_term):
             st.warning("⚠️ Please enter a search term.")
         else:
             with st.spinner("Searching organizations..."):
@@ -370,17 +509,19 @@ with tab4:
 with st.sidebar:
     st.header("API Status")
     
+    force_refresh = st.checkbox("Force refresh", value=False)
+    
     if st.button("Check API Health"):
-        try:
-            health_response = requests.get(HEALTH_URL, timeout=5)
-            if health_response.status_code == 200:
-                health_data = health_response.json()
-                st.success("✅ API is reachable")
-                st.json(health_data)
-            else:
-                st.error(f"⚠️ API returned status: {health_response.status_code}")
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ Cannot connect to API: {e}")
+        health_data, health_error = health_status(force_refresh)
+        if health_error:
+            st.error(health_error)
+        else:
+            st.success("✅ API is reachable")
+            st.json(health_data)
+    
+    if st.button("Clear cache"):
+        st.cache_data.clear()
+        st.success("🧹 Search cache cleared")
     
     st.markdown("---")
     st.markdown("### Search Tips")